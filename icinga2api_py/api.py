@@ -107,9 +107,7 @@ class API(requests.Session):
 		that e.g. updating headers for the clone also updates the headers of the original object. Attribute assignments
 		will have no effect on clone objects of course.
 		"""
-		sessionparams = {}
-		for attr in obj.__attrs__:
-			sessionparams[attr] = getattr(obj, attr, None)
+		sessionparams = {attr: getattr(obj, attr, None) for attr in obj.__attrs__}
 		api = cls(obj.base_url, **sessionparams)
 		return api
 
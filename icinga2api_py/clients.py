@@ -2,25 +2,43 @@
 """This module contains client classes for getting in touch with the Icinga2 API, but only of the layer 2 of this
 library. See the docs for more information."""
 
-import json
+import inspect
+
+try:
+	# msgspec's and orjson's JSON decoders are a lot faster than the standard library's, but optional dependencies
+	from msgspec.json import decode as json_loads
+except ImportError:
+	try:
+		from orjson import loads as json_loads
+	except ImportError:
+		from json import loads as json_loads
 
 from .api import API
 from .models import Query
 from .results import ResultsFromResponse, Result
 
 
+def _response_attribute(name):
+	"""Get a property for the attribute with the given name of the wrapped response."""
+	return property(lambda self: getattr(self._response, name), doc=f"``{name}`` of the response.")
+
+
 class ClientQuery(Query):
 	"""A flexible query, trying to return everything as the results_class of the Client object."""
 
 	def handle_request(self, request):
 		"""Handle the request by passing it to the Client's results_class if possible, pass the response otherwise."""
-		try:
-			# Try to pass the request
-			return self.api.results_class(request=request, **self.api.results_parameters)
-		except TypeError:
-			# Failed to pass the request, pass the response
-			# The request.send() method will use API.create_response(), which returns a APIResponse
-			return self.api.results_class(response=request.send(), **self.api.results_parameters)
+		# Don't even try to pass the request if the results_class is known to not accept it
+		if self.api.results_class_takes_request is not False:
+			try:
+				# Try to pass the request
+				return self.api.results_class(request=request, **self.api.results_parameters)
+			except TypeError:
+				pass
+
+		# Failed to pass the request, pass the response
+		# The request.send() method will use API.create_response(), which returns a APIResponse
+		return self.api.results_class(response=request.send(), **self.api.results_parameters)
 
 
 class Client(API):
@@ -42,9 +60,34 @@ class Client(API):
 		:param sessionparams: Session parameters as for :class:`API`
 		"""
 		super().__init__(url, **sessionparams)
-		self.results_parameters = results_parameters or dict()
+		self.results_parameters = results_parameters if results_parameters is not None else dict()
 		self.results_class = results_class or ResultsFromResponse
 
+	@property
+	def results_class(self):
+		"""The class (or any other callable) to create the results with, see :meth:`__init__`."""
+		return self._results_class
+
+	@results_class.setter
+	def results_class(self, results_class):
+		"""Set the results_class, and whether it takes a request or not (:attr:`results_class_takes_request`)."""
+		self._results_class = results_class
+		#: Whether the results_class accepts a "request" keyword argument, or None if that is unknown
+		self.results_class_takes_request = self._takes_request(results_class)
+
+	@staticmethod
+	def _takes_request(callable_):
+		"""Return whether the callable accepts a "request" keyword argument, or None if that can't be determined."""
+		try:
+			parameters = inspect.signature(callable_).parameters.values()
+		except (TypeError, ValueError):
+			# E.g. some builtins have no signature
+			return None
+		return any(
+			param.kind == param.VAR_KEYWORD or (param.name == "request" and param.kind != param.POSITIONAL_ONLY)
+			for param in parameters
+		)
+
 	@property
 	def request_class(self):
 		return ClientQuery
@@ -70,29 +113,42 @@ class StreamClient(API):
 	class ResultsStream:
 		"""Return Result objects for streamed lines."""
 
-		#: Response attributes, properties and methods that are made available in :meth:`__getattr__`
-		response_attrs = {
+		#: Response attributes, properties and methods that are made available as properties of this class
+		response_attrs = frozenset({
 			"status_code", "headers", "url", "history", "reason", "cookies", "elapsed", "request",
 			"__bool__", "__nonzero__",
 			"ok", "is_redirect", "is_permanent_redirect", "next", "links", "raise_for_status",
-		}
+		})
 
-		def __init__(self, response):
-			self._response = response
+		#: Maximum number of bytes to read from the stream at once. Icinga streams events with chunked transfer encoding,
+		#: every chunk is processed as soon as it is received anyway; so this is just an upper limit.
+		CHUNK_SIZE = 65536
 
-		def __getattr__(self, item):
-			"""Some response attributes are made available here."""
-			if item in self.response_attrs:
-				return getattr(self._response, item)
+		__slots__ = ("_response", )
 
-			raise AttributeError(f"No such attribute: {item}")
+		def __init__(self, response):
+			self._response = response
 
 		def __iter__(self):
 			"""Yield Result objects for every line received."""
-			for line in self._response.iter_lines():
-				if line:
-					res = json.loads(line)
-					yield Result((res, ))
+			# Local names for what is needed for every line
+			loads = json_loads
+			result_class = Result
+			for line in self._lines():
+				# Skip keep-alive and blank lines (also "\r" left over from CRLF line endings)
+				if line.strip():
+					yield result_class((loads(line), ))
+
+		def _lines(self):
+			"""Yield the lines received as bytes, split from the received chunks at once."""
+			pending = b""
+			for chunk in self._response.iter_content(chunk_size=self.CHUNK_SIZE):
+				lines = (pending + chunk).split(b"\n")
+				# The last part is incomplete, until the next chunk completes it
+				pending = lines.pop()
+				yield from lines
+			if pending:
+				yield pending
 
 		def close(self):
 			"""Close stream connection."""
@@ -105,3 +161,9 @@ class StreamClient(API):
 		def __exit__(self, exc_type, exc_val, exc_tb):
 			"""Usage as an context manager closes the stream connection automatically on exit."""
 			self.close()
+
+
+# Make the response attributes available for ResultsStream objects; properties are a lot faster than __getattr__
+for _attr in StreamClient.ResultsStream.response_attrs:
+	setattr(StreamClient.ResultsStream, _attr, _response_attribute(_attr))
+del _attr
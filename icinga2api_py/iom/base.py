@@ -26,6 +26,9 @@ class ParentObjectDescription:
 	session reference is copied from the parent object.
 	"""
 
+	# There is one description per (nested) object, so avoid a __dict__ for each of them
+	__slots__ = ("session", "parent", "field")
+
 	def __init__(self, session=None, parent: "AbstractIcingaObject" = None, field=None):
 		"""Init the parent object description, also see class docstring.
 
@@ -14,7 +14,7 @@ from requests import HTTPError
 
 from icinga2api_py.models import APIResponse
 from .exceptions import NoUserView, NoUserModify
-from ..results import ResultSet, CachedResultSet, SingleResultMixin
+from ..results import ResultSet, CachedResultSet, SingleResultMixin, objects_filter
 from .base import TypeNumber, AbstractIcingaObject, ParentObjectDescription
 
 # Possible keys of an objects query result
@@ -138,12 +138,8 @@ class IcingaConfigObjects(CachedResultSet, IcingaObjects):
 
 		# Get names of the objects in this slice
 		names = [res["name"] for res in results]
-		# Construct a filter for these names
-		# TODO make this work for objects with composite names (e.g. services)
-		filterstring = "{}.name==\"{}\"".format(
-			self.type.lower(),
-			"\" || {}.name==\"".format(self.type.lower()).join(names)
-		)
+		# Construct a filter for these names (that matches nothing if there are no names)
+		filterstring = objects_filter(self.type, names) or "false"
 
 		# Copy query for these objects
 		req = self.request.clone()
@@ -274,9 +270,7 @@ class IcingaConfigObjects(CachedResultSet, IcingaObjects):
 		mquery = self._request.clone()
 		mquery.method_override = "POST"
 		# Copy original JSON body and overwrite attributes for modification
-		data = dict(mquery.json)["attrs"] = {}
-		data["attrs"] = modification
-		mquery.json = data
+		mquery.json = {**mquery.json, "attrs": modification}
 		# Fire modification query (returns APIResponse object)
 		return mquery()
 
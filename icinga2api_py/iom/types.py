@@ -78,7 +78,7 @@ class Types(CachedResultSet):
 		elif number == TypeNumber.PLURAL:
 			item = item + 's' if item[-1] != 's' else item
 		else:
-			number = TypeNumber.PLURAL if item[-1] == 's' else TypeNumber.PLURAL
+			number = TypeNumber.PLURAL if item[-1] == 's' else TypeNumber.SINGULAR
 
 		if item.lower() in self.ICINGA_PYTHON_TYPES:
 			# Types mapped directly for advanced functionality
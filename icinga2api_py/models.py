@@ -134,9 +134,14 @@ class APIResponse:
 	This is basically just a wrapper for ``requests.Response``, adding only minor features.
 	"""
 
+	#: Marker for the JSON content not being parsed yet
+	_NOT_PARSED = object()
+
 	def __init__(self, response: Response):
 		#: The :class:`requests.Response` this APIRequest wraps
 		self.response = response
+		# Parsed JSON content, see json()
+		self._json = self._NOT_PARSED
 
 	def __getattr__(self, item):
 		"""Get an attribute of the response."""
@@ -156,7 +161,19 @@ class APIResponse:
 			return True
 
 	def json(self, **kwargs):
-		"""JSON encoded content of the response (if any). Returns None on error."""
+		"""JSON encoded content of the response (if any). Returns None on error.
+
+		The content is parsed only once if there are no keyword arguments (which get passed to the JSON decoder), the
+		same object is returned on every call then.
+		"""
+		if kwargs:
+			return self._parse_json(**kwargs)
+		if self._json is self._NOT_PARSED:
+			self._json = self._parse_json()
+		return self._json
+
+	def _parse_json(self, **kwargs):
+		"""Parse the JSON encoded content of the response, returns None on error."""
 		try:
 			return self.response.json(**kwargs)
 		except ValueError:
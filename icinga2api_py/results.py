@@ -8,6 +8,29 @@ import time
 import typing
 
 
+def objects_filter(type_: str, object_names: typing.Iterable):
+	"""Create a filter for the Icinga API that filters for the objects given by name (as sequence of strings) and
+	type (just one string describing the type of all the objects).
+
+	:returns The filter as a string, or None if filter construction was not possible.
+	"""
+	if not type_:
+		return None
+	type_ = type_.lower()
+	if type_ == "service":
+		# Services are objects that are specified as <host>!<service>
+		parts = []
+		append = parts.append
+		for name in object_names:
+			host, service = name.split('!', 1)
+			append(f'(host.name=="{host}" && service.name=="{service}")')
+	else:
+		# Default is the simplest possible filter: <type>.name=="<name>"
+		parts = [f'{type_}.name=="{obj}"' for obj in object_names]
+
+	return " || ".join(parts) or None
+
+
 class ResultSet(collections.abc.Sequence):
 	"""Represents a set of results returned from the Icinga2 API.
 
@@ -269,11 +292,8 @@ class ResultsFromRequest(ResultsFromResponse):
 	def response(self):
 		"""Loads response with use of the request - this property is ironically called from the load method."""
 		if self._response is None:
-			try:
-				self._response = self._request()
-			except TypeError:
-				# In case the request is None
-				self._response = self._request_lambda()
+			# Calls the request, or returns the response given on init if there is no request
+			self._response = self._request_lambda()
 
 		return self._response
 
@@ -400,7 +420,8 @@ class ResultList(ResultSet, collections.abc.MutableSequence):
 	def __init__(self, results=None, result_class=None):
 		"""A ResultList can be initiated with a sequence of mapping objects or one mapping object."""
 		super().__init__(None)
-		if not isinstance(results, collections.abc.Sequence):
+		# Checking for list and tuple first is a lot faster than the check against the Sequence ABC
+		if not isinstance(results, (list, tuple)) and not isinstance(results, collections.abc.Sequence):
 			results = list() if not results else [dict(results)]
 		self._results = list(results)
 
@@ -467,9 +488,12 @@ class SingleResultMixin:
 		results = super().results
 
 		# Return a sequence with exactly one item, no matter which type the results have
+		# The usual concrete types are checked first, because that is a lot faster than the check for the Sequence ABC
 		if results is None:
 			return tuple()
-		if isinstance(results, collections.abc.Sequence):
+		if isinstance(results, dict):
+			return results,
+		if isinstance(results, (tuple, list)) or isinstance(results, collections.abc.Sequence):
 			try:
 				return results[0],
 			except IndexError:
@@ -509,9 +533,21 @@ class SingleResultMixin:
 		if isinstance(item, int) or isinstance(item, slice):
 			return self.result(item)
 
+		if type(item) is str and '.' not in item and type(self).parse_attrs is ResultSet.parse_attrs:
+			# Fast path for the most common case of a plain key like "name" or "type"
+			# Only if parse_attrs() is not overridden, which may map even plain keys to something else
+			try:
+				return self._raw[item]
+			except KeyError:
+				raise KeyError(f"No such key: {item}") from None
+
 		# Mapping access: Get attr of raw result
 		return self.attr_value(self.parse_attrs(item), self._raw)
 
+	def __iter__(self: SingleResultMixinType):
+		"""Iterate over this one result itself, instead of creating a new object for it (or over nothing if empty)."""
+		return iter((self, ) if self.results else ())
+
 	def __contains__(self: SingleResultMixinType, item):
 		"""Whether there is a value for the given key, or the value is in the results list."""
 		try:
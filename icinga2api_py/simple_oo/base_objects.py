@@ -4,37 +4,19 @@
 
 import collections.abc
 import logging
-from typing import Iterable
 
-from ..results import CachedResultSet, ResultList, SingleResultMixin
+from ..results import CachedResultSet, ResultList, SingleResultMixin, objects_filter
 
 LOGGER = logging.getLogger(__name__)
 
-
-def objects_filter(type_: str, object_names: Iterable):
-	"""Create a filter for the Icinga API that filters for the objects given by name (as sequence of strings) and
-	type (just one string describing the type of all the objects).
-
-	:returns The filter as a string, or None if filter construction was not possible.
-	"""
-	if not type_:
-		return None
-	type_ = type_.lower()
-	if type_ == "service":
-		# Services are objects that are specified as <host>!<service>
-		host_service_pairs = (name.split('!', 1) for name in object_names)
-		fstringbuilder = (
-			"(host.name==\"{}\" && service.name==\"{}\")".format(host, service)
-			for host, service in host_service_pairs
-		)
-	else:
-		# Default is the simplest possible filter: <type>.name=="<name>"
-		fstringbuilder = (
-			"{}.name==\"{}\"".format(type_, obj)
-			for obj in object_names
-		)
-
-	return " || ".join(fstringbuilder) or None
+#: Names of the Icinga object types as expected by the API, mapped from their lowercase names
+TYPE_NAMES = {
+	name.lower(): name for name in (
+		"Host", "Service", "HostGroup", "ServiceGroup", "User", "UserGroup", "TimePeriod", "Notification",
+		"Downtime", "ScheduledDowntime", "Comment", "Dependency", "CheckCommand", "EventCommand",
+		"NotificationCommand", "Endpoint", "Zone", "ApiUser",
+	)
+}
 
 
 class Icinga2Objects(CachedResultSet):
@@ -42,18 +24,31 @@ class Icinga2Objects(CachedResultSet):
 	This class is a CachedResultSet, so a Request is used to (re)load the response its results on demand or after cache
 	expiry (time in seconds)."""
 
+	#: Objects filter together with the (internal) results it was created for, see objects_filter()
+	_filter_cache = (None, None)
+
 	@property
 	def type(self):
 		"""The Icinga object type, or None if there are no objects."""
 		try:
-			return self[0]["type"]
+			return self.results[0]["type"]
 		except IndexError:
 			# Maybe this is a good idea, maybe it's not... TODO think about it again
 			return None
 
 	def objects_filter(self):
-		"""Get a Icinga API filter that filters for the objects of self."""
-		return objects_filter(self.type, (obj["name"] for obj in self))
+		"""Get a Icinga API filter that filters for the objects of self.
+
+		The filter is cached as long as the same results are loaded; every (re)load creates new results, so the
+		filter is created again after that.
+		"""
+		results = self.results
+		if self._filter_cache[0] is self._results:
+			return self._filter_cache[1]
+
+		fstring = objects_filter(results[0]["type"], [res["name"] for res in results]) if results else None
+		self._filter_cache = (self._results, fstring)
+		return fstring
 
 	def result_as(self, index, class_):
 		"""Get single result at given index as a given definded type (results.Result, Icinga2Object or Icinga2Object
@@ -63,29 +58,31 @@ class Icinga2Objects(CachedResultSet):
 			# Handles slicing
 			return super().result(index)
 
+		# Raw results of the object(s) at index
+		results = self.results[index] if isinstance(index, slice) else (self.results[index], )
+
 		# Don't attempt to clone the request if there is no request
 		has_request = self._request is not None
 
-		# Construct Icinga2ObjectList with object of class_
-		ret = list()
-		for res in super().result(index):
-			# Build request
-			if has_request:
-				req = self._request.clone()
-				req.json = {"filter": objects_filter(res["type"], (res["name"],))}
-			else:
-				req = None
-			ret.append(class_(
-				request=req, results=res,
-				cache_time=self.cache_time, next_cache_expiry=self._expires
-			))
-
-		lst = Icinga2ObjectList(ret)
+		def request(res):
+			"""Build the request for the object of a result."""
+			if not has_request:
+				return None
+			# Every object needs its own copy of the request (headers, params, ...), to be modified independently
+			req = self._request.clone()
+			req.json = {"filter": objects_filter(res["type"], (res["name"], ))}
+			return req
+
+		# Construct objects of class_ in one go
+		objects = [
+			class_(request=request(res), results=res, cache_time=self.cache_time, next_cache_expiry=self._expires)
+			for res in results
+		]
 
 		if isinstance(index, slice):
-			return lst
+			return Icinga2ObjectList(objects)
 
-		return ret[0]
+		return objects[0]
 
 	def result(self, index):
 		"""Return the Icinga2Object at this index."""
@@ -101,9 +98,8 @@ class Icinga2Objects(CachedResultSet):
 		# Copy and modify the request from which these results were loaded
 		mquery = self._request.clone()
 		mquery.method_override = "POST"
-		body = dict(mquery.json)  # Copy original body (filters, ...)
-		body["attrs"] = attrs  # Set new attributes
-		mquery.json = body
+		# Copy original body (filters, ...) with the new attributes set
+		mquery.json = {**mquery.json, "attrs": attrs}
 		ret = mquery()  # Execute modify query
 		if not no_invalidate:
 			self.invalidate()  # Reset cache to avoid caching something wrong
@@ -133,18 +129,20 @@ class ActionMixin:
 		same for all objects (should be...). With this information, a filter is created, that should match all Icinga2
 		objects represented.
 		"""
-		if len(self) < 1:
+		results = self.results
+		if not results:
 			return None
-		type_ = self.type
-		names = (obj["name"] for obj in self)
-		LOGGER.debug("Processing action {} for {} objects of type {}".format(action, len(self), type_))
-		fstring = objects_filter(self.type, names)
+		type_ = results[0]["type"]
+		LOGGER.debug("Processing action %s for %d objects of type %s", action, len(results), type_)
+		fstring = self.objects_filter()
 
 		if not fstring:
 			return None
 
 		# self._request.api = Icinga2 (client) instance
-		query = self._request.api.actions.s(action).type(type_.title()).filter(fstring)
+		# The type as expected by the API, e.g. "HostGroup" for "hostgroup" (title() would return "Hostgroup")
+		type_ = TYPE_NAMES.get(type_.lower(), type_.title())
+		query = self._request.api.actions.s(action).type(type_).filter(fstring)
 		for parameter, value in parameters.items():
 			query = query.s(parameter)(value)
 		return query.post()
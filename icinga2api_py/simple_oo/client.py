@@ -3,10 +3,13 @@
 
 import logging
 import functools
+import collections
+import threading
+import concurrent.futures
 from typing import Mapping, Sequence
 
 from ..api import API
-from ..simple_oo.base_objects import Icinga2Objects, Icinga2Object
+from ..simple_oo.base_objects import Icinga2Objects, Icinga2Object, TYPE_NAMES
 from ..clients import Client
 from ..models import Query
 from ..results import ResultsFromResponse, CachedResultSet
@@ -14,6 +17,31 @@ from ..simple_oo import objects
 
 LOGGER = logging.getLogger(__name__)
 
+#: Plural forms of the (lowercase) Icinga object type names, as used in URLs
+_PLURAL = {name: name + "s" for name in TYPE_NAMES}
+_PLURAL["dependency"] = "dependencies"
+#: Singular forms of the plural Icinga object type names
+_SINGULAR = {plural: singular for singular, plural in _PLURAL.items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _plural(type_: str) -> str:
+	"""Plural form of the given object type name, the letter 's' is appended for unknown types."""
+	return _PLURAL.get(type_, type_ if type_[-1:] == "s" else type_ + "s")
+
+
+@functools.lru_cache(maxsize=64)
+def _singular(type_: str) -> str:
+	"""Singular form of the given object type name, the last letter 's' is cut for unknown types."""
+	return _SINGULAR.get(type_, type_[:-1] if type_[-1:] == "s" else type_)
+
+
+#: Classes specialised for an object type in the objects module, by lowercase type name
+_OBJECT_CLASSES = {
+	name.lower(): class_ for name, class_ in vars(objects).items()
+	if isinstance(class_, type) and class_.__module__ == objects.__name__
+}
+
 
 class OOQuery(Query):
 	"""Helper class to return an appropriate object for a query.
@@ -57,10 +85,8 @@ class OOQuery(Query):
 			type_ = basetype
 			name = None
 
-		# Cut last letter 's' of plural form if name is known (= if single object)
-		type_ = type_[:-1] if name is not None and type_[-1:] == "s" else type_
-		# Append letter 's' if it's not a single object (= name not known)
-		type_ = type_ + 's' if name is None and type_[-1] != "s" else type_
+		# Singular form if name is known (= if single object), plural form otherwise
+		type_ = _singular(type_) if name is not None else _plural(type_)
 		LOGGER.debug("Assumed type %s and name %s from URL %s", type_, name, self.url)
 		return basetype, type_, name
 
@@ -97,9 +123,19 @@ class OOQuery(Query):
 		"""Get a appropriate Python object to represent whatever is requested with this query.
 
 		This method assumes, that a named object is singular (= one object). The name is not used.
+		If the client has an object cache (see :class:`Icinga2`), an object created before for an equal request is
+		returned instead of a new one.
 		"""
+		if not self.api.object_cache_size:
+			return self._create_object(type_, name, request)
+		# The URL contains type and name
+		key = (request.url, repr(request.params), repr(request.json))
+		return self.api.cached_object(key, functools.partial(self._create_object, type_, name, request))
+
+	def _create_object(self, type_: str, name, request):
+		"""Create the object for object_from_query()."""
 		# Look for a class specialised for that object type in the objects module
-		class_ = getattr(objects, type_.title(), None)
+		class_ = _OBJECT_CLASSES.get(type_.lower())
 		if class_ is not None:
 			# Found a class, so return an appropriate object of that class
 			return class_(request=request, cache_time=self.api.cache_time)
@@ -112,9 +148,28 @@ class OOQuery(Query):
 class Icinga2(API):
 	"""An object oriented Icinga2 API client."""
 
-	def __init__(self, url: str, cache_time=float("inf"), **sessionparams):
+	#: Maximum number of threads sending requests concurrently for create_object_async() and create_objects()
+	MAX_WORKERS = 16
+
+	def __init__(self, url: str, cache_time=float("inf"), object_cache_size=0, **sessionparams):
+		"""Create the client.
+
+		:param url: The base URL as for :class:`icinga2api_py.api.API`
+		:param cache_time: Time in seconds the results of the returned objects are cached
+		:param object_cache_size: Number of objects to reuse for equal queries, the least recently used are dropped
+			first. Reusing an object also reuses its cached results, so that no request is sent before the cache_time
+			expired. Defaults to 0, which disables reusing objects.
+		:param sessionparams: Session parameters as for :class:`icinga2api_py.api.API`
+		"""
 		super().__init__(url, **sessionparams)
 		self.cache_time = cache_time
+		self.object_cache_size = object_cache_size
+		# Objects for queries, in least recently used order
+		self._objects = collections.OrderedDict()
+		# Thread pool for concurrent requests, created on demand
+		self._executor = None
+		# Lock to create (and shut down) the thread pool only once, even if called from multiple threads
+		self._executor_lock = threading.Lock()
 
 	@property
 	def request_class(self):
@@ -128,9 +183,63 @@ class Icinga2(API):
 		"""Get basic API client."""
 		return API.clone(self)
 
+	def cached_object(self, key, create):
+		"""Get the object cached with the given key, or cache the object returned by calling create()."""
+		try:
+			self._objects.move_to_end(key)
+			return self._objects[key]
+		except KeyError:
+			pass
+
+		obj = self._objects[key] = create()
+		if len(self._objects) > self.object_cache_size:
+			# Drop the least recently used object
+			self._objects.popitem(last=False)
+		return obj
+
 	def create_object(self, type_: str, name, attrs: Mapping, templates: Sequence = tuple(), ignore_on_error=False):
 		"""Create an Icinga2 object through the API."""
-		type_ = type_.lower()
-		type_ = type_ if type_[-1:] == "s" else type_ + "s"
-		return self.objects.s(type_).s(name).templates(list(templates)).attrs(attrs)\
-			.ignore_on_error(bool(ignore_on_error)).put()  # Fire request immediately
+		type_ = _plural(type_.lower())
+		# Build the request directly, that's the same the request builder would do (via self.objects...)
+		url = f"{self.base_url}objects/{type_}/{name}"
+		body = {"templates": list(templates), "attrs": attrs, "ignore_on_error": bool(ignore_on_error)}
+		return self.request_class(self, "PUT", url, json=body)()  # Fire request immediately
+
+	def _submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+		"""Call the given function with the given arguments in a thread of the thread pool of this client."""
+		with self._executor_lock:
+			if self._executor is None:
+				self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+			return self._executor.submit(fn, *args, **kwargs)
+
+	def create_object_async(self, type_: str, name, attrs: Mapping, templates: Sequence = tuple(),
+							ignore_on_error=False) -> concurrent.futures.Future:
+		"""Create an Icinga2 object through the API in a background thread, see create_object().
+
+		:return: A future for the return value of create_object()
+		"""
+		return self._submit(self.create_object, type_, name, attrs, templates, ignore_on_error)
+
+	def create_objects(self, specs):
+		"""Create multiple Icinga2 objects through the API, sending the requests concurrently.
+
+		:param specs: Iterable of keyword arguments (as mappings) for create_object(), one per object to create
+		:return: List of (spec, result) tuples in the order of specs, where the result is the return value of
+			create_object() or the exception raised by it
+		"""
+		futures = [(spec, self._submit(self.create_object, **spec)) for spec in specs]
+		results = []
+		for spec, future in futures:
+			try:
+				results.append((spec, future.result()))
+			except Exception as exc:
+				results.append((spec, exc))
+		return results
+
+	def close(self):
+		"""Wait for the threads of the thread pool to finish (if there are any), and close the session."""
+		with self._executor_lock:
+			executor, self._executor = self._executor, None
+		if executor is not None:
+			executor.shutdown()
+		super().close()
@@ -5,6 +5,8 @@
 import logging
 from ..simple_oo.base_objects import Icinga2Objects, Icinga2Object, ActionMixin
 
+LOGGER = logging.getLogger(__name__)
+
 
 class Host(Icinga2Object, ActionMixin):
 	"""Representation of a Icinga2 Host object."""
@@ -14,7 +16,7 @@ class Host(Icinga2Object, ActionMixin):
 		try:
 			return self._request.api.objects.services.filter("host.name==\"{}\"".format(self.name)).get()
 		except AttributeError:
-			logging.getLogger(__name__).exception("Exception constructing services from a Host object.")
+			LOGGER.exception("Exception constructing services from a Host object.")
 
 
 class Hosts(Icinga2Objects, ActionMixin):
@@ -33,7 +35,7 @@ class Service(Icinga2Object, ActionMixin):
 			hostname = self["attrs"]["host_name"]
 			return self._request.api.objects.hosts.s(hostname).get()
 		except AttributeError:
-			logging.getLogger(__name__).exception("Exception constructing Host object from Service object.")
+			LOGGER.exception("Exception constructing Host object from Service object.")
 
 
 class Services(Icinga2Objects, ActionMixin):
@@ -27,6 +27,7 @@ setup(
 	extras_require={
 		"test": ["pytest"],
 		"doc": ["Sphinx"],
+		"speedups": ["msgspec"],
 	},
 	classifiers=[
 		"Programming Language :: Python :: 3",
@@ -111,3 +111,16 @@ def test_type_number(types, item, number, expected_type):
 	number = getattr(TypeNumber, number.upper())
 	cls = types.type(item, number=number)
 	assert cls is expected_type
+
+
+@pytest.mark.parametrize("item, classname", (
+		("Host", "Host"),
+		("Hosts", "Hosts"),
+		("Service", "Service"),
+		("Services", "Services"),
+))
+def test_type_number_irrelevant(types, item, classname):
+	"""Test that Types.type() creates a singular or plural class depending on the given name by default."""
+	# Fresh Types object, to avoid getting classes created by other tests
+	types = types_module.Types(types.iclient)
+	assert types.type(item).__name__ == classname
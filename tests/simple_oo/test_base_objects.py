@@ -61,6 +61,34 @@ def test_objects_filter(i):
 	assert obj.objects_filter() == res
 
 
+def test_objects_filter_cache():
+	"""Test that the objects filter is cached until the results are reloaded."""
+	obj = Icinga2Objects(EXAMPLE_OBJECTS[2].results)
+	fstring = obj.objects_filter()
+	assert fstring == EXAMPLE_FILTERS[2]
+	assert obj.objects_filter() is fstring
+	# Without a request, there are no results after invalidation
+	obj.invalidate()
+	assert obj.objects_filter() is None
+
+
+def test_objects_filter_reload():
+	"""Test that the objects filter follows the results on load(), also with an infinite cache time."""
+	names = ["localhost"]
+
+	class FakeResponse:
+		@staticmethod
+		def results(**json_kwargs):
+			return tuple({"type": "Host", "name": name} for name in names)
+
+	obj = Icinga2Objects(request=FakeResponse, cache_time=float("inf"))
+	assert obj.objects_filter() == EXAMPLE_FILTERS[1]
+	# The data changes, and the results are explicitely reloaded
+	names.append("icinga")
+	obj.load()
+	assert obj.objects_filter() == EXAMPLE_FILTERS[2]
+
+
 @pytest.mark.parametrize("i", [i for i in range(3)])
 def test_result(i):
 	"""Test Icinga2Objects.result() (and therefore also a bit result_as())."""
@@ -69,6 +97,14 @@ def test_result(i):
 	assert res["name"] == EXAMPLE_NAMES[3][i]
 
 
+def test_object_iter():
+	"""Test iterating over an Icinga2Object."""
+	obj = EXAMPLE_OBJECTS[3][0]
+	assert list(obj) == [obj]
+	assert next(iter(obj)) is obj
+	assert list(Icinga2Object(tuple())) == []
+
+
 #######################################################################################################################
 # Test that need a request (and at first the deeply faked request)
 #######################################################################################################################
@@ -159,6 +195,18 @@ def test_modify(fake_request2):
 	assert ret.json["attrs"] == attrs
 
 
+def test_slice_requests_independent(fake_request2):
+	"""Test that modifying the request of one object of a slice leaves the requests of the other objects alone."""
+	obj = Icinga2Objects(EXAMPLE_OBJECTS[3].results, request=fake_request2)
+	a, b = obj[0:2]
+	a.request.method_override = "DELETE"
+	a.request.params.update({"cascade": 1})
+	assert b.request.method_override != "DELETE"
+	assert "cascade" not in b.request.params
+	assert fake_request2.method_override != "DELETE"
+	assert "cascade" not in fake_request2.params
+
+
 def test_delete(fake_request2):
 	"""Test Icinga2Objects.delete()."""
 	obj = Icinga2Objects(request=fake_request2)
@@ -3,13 +3,20 @@
 Tests for the simple_oo.client module.
 """
 
+import time
+import threading
+import concurrent.futures
+
 import pytest
 
-from ..icinga_mock import mock_session_handler
+from ..icinga_mock import mock_session, mock_session_handler
 
+from icinga2api_py.api import API
+from icinga2api_py.clients import Client
 from icinga2api_py.results import ResultsFromResponse, CachedResultSet
 from icinga2api_py.simple_oo.client import Icinga2
 from icinga2api_py.simple_oo.base_objects import Icinga2Object, Icinga2Objects
+from icinga2api_py.simple_oo.objects import Host, Hosts
 
 URL = "http://icinga:1234/v1/"
 API_CLIENT_KWARGS = {
@@ -30,6 +37,9 @@ def icinga_client():
 		(("objects", "hosts"), Icinga2Objects),
 		# Object get
 		(("objects", "hosts", "name"), Icinga2Object),
+		# Objects of types with a specialised class
+		(("objects", "hosts"), Hosts),
+		(("objects", "hosts", "name"), Host),
 		# Status is information, but not really an object
 		(("status", "IcingaApplication"), CachedResultSet),
 		# Everything with /config is not really an object
@@ -49,9 +59,93 @@ def test_ooquery_decisions(icinga_client, req, expected_type):
 	assert isinstance(res, expected_type)
 
 
+def test_client_clones(icinga_client):
+	"""Test that Icinga2.client() and Icinga2.api() return a new clone on every call."""
+	client = icinga_client.client()
+	assert isinstance(client, Client)
+	assert client is not icinga_client.client()
+	# Connection pools are shared with the original anyway
+	assert client.adapters is icinga_client.adapters
+
+	api = icinga_client.api()
+	assert type(api) is API
+	assert api is not icinga_client.api()
+
+
+def test_object_cache():
+	"""Test that objects are reused for equal queries if an object cache is enabled."""
+	with Icinga2(URL, object_cache_size=1, **API_CLIENT_KWARGS) as client:
+		mock_session(client)
+		localhost = client.objects.hosts.localhost.get()
+		assert localhost is client.objects.hosts.localhost.get()
+		assert client.objects.hosts.get() is not localhost
+		# The least recently used object was dropped
+		assert client.objects.hosts.localhost.get() is not localhost
+
+
+def test_no_object_cache(icinga_client):
+	"""Test that objects are not reused by default."""
+	assert icinga_client.objects.hosts.localhost.get() is not icinga_client.objects.hosts.localhost.get()
+
+
 def test_create_object(icinga_client):
 	"""Test Icinga.create_object()."""
 	res = icinga_client.create_object("host", "host123", {})
 	assert isinstance(res, ResultsFromResponse)
 	assert len(res) == 1
 	assert res[0]["code"] == 200
+
+
+@pytest.mark.parametrize("path,expected", (
+		(("objects", "hosts"), ("objects", "hosts", None)),
+		(("objects", "hosts", "localhost"), ("objects", "host", "localhost")),
+		(("objects", "dependencies"), ("objects", "dependencies", None)),
+		(("objects", "dependencies", "dep"), ("objects", "dependency", "dep")),
+		(("objects", "unknowns", "abc"), ("objects", "unknown", "abc")),
+		(("objects", "unknown"), ("objects", "unknowns", None)),
+))
+def test_ooquery_url_infos(icinga_client, path, expected):
+	"""Test that OOQuery finds basetype, type and name in the URL."""
+	query = icinga_client
+	for item in path:
+		query = query.s(item)
+	assert query.get._url_infos() == expected
+
+
+def test_create_objects(icinga_client):
+	"""Test Icinga.create_object_async() and Icinga.create_objects()."""
+	res = icinga_client.create_object_async("host", "host123", {}).result()
+	assert res[0]["code"] == 200
+
+	specs = [{"type_": "host", "name": f"host{i}", "attrs": {}} for i in range(5)]
+	specs.append({"type_": "host"})
+	results = icinga_client.create_objects(specs)
+	assert [spec for spec, _ in results] == specs
+	for _, res in results[:-1]:
+		assert res[0]["code"] == 200
+		assert res.response.ok
+	assert isinstance(results[-1][1], TypeError)
+
+
+def test_submit_concurrently(monkeypatch):
+	"""Test that concurrent calls of Icinga2._submit() create only one thread pool."""
+	client = Icinga2(URL)
+	created = []
+	executor_class = concurrent.futures.ThreadPoolExecutor
+
+	def create_executor(*args, **kwargs):
+		created.append(executor_class(*args, **kwargs))
+		# Give other threads a chance to also create a thread pool
+		time.sleep(0.01)
+		return created[-1]
+
+	monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", create_executor)
+	threads = [threading.Thread(target=client._submit, args=(int, )) for _ in range(5)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert len(created) == 1
+
+	client.close()
+	assert client._executor is None
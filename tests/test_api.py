@@ -325,6 +325,8 @@ def test_response_eq(api_client):
 def test_response_results(responses):
 	"""Test APIResponse.json()"""
 	assert isinstance(responses.localhost.json(), Mapping)
+	# Parsed only once
+	assert responses.localhost.json() is responses.localhost.json()
 
 	assert isinstance(responses.localhost.results(), Sequence)
 	assert len(responses.e404.results()) == 0
@@ -75,6 +75,23 @@ def test_client_response(response_client):
 	assert isinstance(responses.localhost.results(), Sequence)
 
 
+def test_client_results_class_takes_request():
+	"""Test the detection whether the results class takes a request."""
+	assert Client(URL, results_class=fake_request_accepting_class).results_class_takes_request is True
+	assert Client(URL, results_class=fake_response_accepting_class).results_class_takes_request is False
+	assert Client(URL, results_class=lambda **kwargs: kwargs).results_class_takes_request is True
+	# Unknown for some builtins
+	assert Client(URL, results_class=dict).results_class_takes_request is None
+
+
+def test_client_results_parameters():
+	"""Test that every client gets its own (modifiable) results parameters by default."""
+	client1, client2 = Client(URL), Client(URL)
+	client1.results_parameters["a"] = "b"
+	assert client1.results_parameters == {"a": "b"}
+	assert client2.results_parameters == {}
+
+
 #######################################################################################################################
 # StreamClient
 #######################################################################################################################
@@ -83,6 +100,8 @@ def test_stream_client(stream_client):
 	"""Test the StreamClient."""
 	type_ = "CheckResult"
 	with stream_client.events.types([type_]).queue("abcdefg").post() as stream:
+		assert stream.status_code == 200
+		assert stream.ok
 		i = 0
 		for res in stream:
 			# Icinga sets the type, as well as the mocked Icinga
@@ -90,3 +109,24 @@ def test_stream_client(stream_client):
 			i += 1
 			if i > 2:
 				break
+
+
+def test_stream_lines():
+	"""Test that streamed lines are reassembled from arbitrary chunks."""
+	class ChunkedResponse:
+		"""Fake response with lines split at arbitrary positions."""
+		@staticmethod
+		def iter_content(chunk_size=None):
+			return iter((b'{"a": 1}\n{"a"', b': 2}\n', b'\n{"a": 3}\r\n{"a":', b' 4}'))
+
+	stream = StreamClient.ResultsStream(ChunkedResponse())
+	assert not hasattr(stream, "__dict__")
+	assert [res["a"] for res in stream] == [1, 2, 3, 4]
+
+	class CRLFResponse:
+		"""Fake response with CRLF line endings and a blank line."""
+		@staticmethod
+		def iter_content(chunk_size=None):
+			return iter((b'{"a": 1}\r\n\r\n{"a": 2}\r\n', ))
+
+	assert [res["a"] for res in StreamClient.ResultsStream(CRLFResponse())] == [1, 2]
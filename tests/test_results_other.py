@@ -94,6 +94,20 @@ def test_request_init(cls, json_kwargs, api_request):
 	assert rs.results == resp.results(**json_kwargs)
 
 
+def test_request_typeerror():
+	"""Test that a TypeError raised by the request is not mistaken for a missing request."""
+	calls = []
+
+	def request():
+		calls.append(1)
+		raise TypeError("raised by the request")
+
+	rs = ResultsFromRequest(request=request)
+	with pytest.raises(TypeError):
+		_ = rs.response
+	assert len(calls) == 1
+
+
 def test_resultsfromrequest_eq():
 	"""Test ResultsFromRequest.__eq__()."""
 	rs1 = ResultsFromRequest(1)
@@ -202,13 +216,17 @@ def test_result():
 	assert res == Result((d, ))
 	# Test item access
 	assert res["a"] == "b"
+	assert res["d.a"] == 1
+	assert res["d"] == d["d"]
+	with pytest.raises(KeyError):
+		_ = res["x"]
 	assert "a" in res
 	assert list(res.keys()) == ["a", "d"]
 	assert tuple(res.items()) == tuple(d.items())
 	assert tuple(res.values()) == ("b", d["d"])
 
 	assert len(res) == 1
-	assert next(iter(res)) == res
+	assert next(iter(res)) is res
 
 	# Should not raise IndexError
 	_ = res[0]
@@ -216,6 +234,18 @@ def test_result():
 		_ = res[1]
 
 
+def test_result_parse_attrs():
+	"""Test that item access of a Result uses an overridden parse_attrs(), also for plain keys."""
+	class AttrsResult(Result):
+		"""Result that maps keys into the "d" dictionary."""
+		@staticmethod
+		def parse_attrs(attrs):
+			return ["d"] + attrs.split('.')
+
+	res = AttrsResult({"a": "b", "d": {"a": 1}})
+	assert res["a"] == 1
+
+
 def test_result_empty():
 	"""Test with an empty Result object."""
 	res = Result()
@@ -229,6 +259,7 @@ def test_result_empty():
 
 	assert len(res) == 0
 	assert bool(res) is False
+	assert list(res) == lst
 
 	with pytest.raises(IndexError):
 		_ = res[0]